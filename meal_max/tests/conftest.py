@@ -0,0 +1,3 @@
+def pytest_configure(config):
+    # pytest-xdist registers this marker itself; declare it too so runs without xdist stay warning-free
+    config.addinivalue_line("markers", "xdist_group(name): run the marked tests on the same xdist worker")
@@ -1,73 +1,104 @@
+import copy
+import re
+from unittest.mock import MagicMock, patch
+
 import pytest
-from meal_max.models.battle_model import BattleModel
+from meal_max.models.battle_model import BattleModel, update_meal_stats
 from meal_max.models.kitchen_model import Meal
+from meal_max.utils.random_utils import get_random
 
 
-@pytest.fixture()
-def setup_battle():
-    """Create a new instance of BattleModel for isolated test execution."""
+# The BattleModel template and the get_random patch are shared by every battle test
+pytestmark = pytest.mark.xdist_group("battle")
+
+
+_RE_NOT_ENOUGH_COMBATANTS = re.compile(r"Two combatants must be prepped for a battle\.")
+_RE_COMBATANTS_FULL = re.compile(r"Combatant list is full, cannot add more combatants\.")
+
+_update_meal_stats_mock_template = MagicMock(spec=update_meal_stats)
+_get_random_mock = MagicMock(spec=get_random)
+
+
+@pytest.fixture(scope="session")
+def _battle_template():
+    """Build a single BattleModel instance to be shared as a template for the session."""
     return BattleModel()
 
 
-@pytest.fixture
-def patch_meal_stats(mocker):
-    """Simulates the update_meal_stats function for controlled testing."""
-    return mocker.patch("meal_max.models.battle_model.update_meal_stats")
+@pytest.fixture()
+def setup_battle(_battle_template):
+    """Copy the BattleModel template with a fresh combatants list for isolated test execution."""
+    battle = copy.copy(_battle_template)
+    battle.combatants = []
+    return battle
 
 
-"""Fixtures to generate example meals for testing various cases."""
 @pytest.fixture
-def test_meal_1():
-    return Meal(1, 'Meal 1', 'Cuisine 1', 20.00, 'LOW')
+def patch_meal_stats(monkeypatch):
+    """Simulates the update_meal_stats function for controlled testing.
 
+    The mock is built once at import time and reset before each test.
+    """
+    _update_meal_stats_mock_template.reset_mock()
+    monkeypatch.setattr("meal_max.models.battle_model.update_meal_stats", _update_meal_stats_mock_template)
+    return _update_meal_stats_mock_template
 
-@pytest.fixture
-def test_meal_2():
-    return Meal(2, 'Meal 2', 'Cuisine 2', 25.00, 'MED')
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_get_random():
+    """Keeps battle tests away from random.org by patching get_random once for the module."""
+    with patch("meal_max.models.battle_model.get_random", _get_random_mock):
+        yield _get_random_mock
 
 
 @pytest.fixture
-def test_meal_collection(test_meal_1, test_meal_2):
-    return [test_meal_1, test_meal_2]
+def mock_random():
+    """Provides the patched get_random with its return value and side effects cleared."""
+    _get_random_mock.reset_mock(return_value=True, side_effect=True)
+    return _get_random_mock
+
+
+# Combatant presets, one row of Meal arguments per combatant; add a preset to rerun every test using it
+COMBATANT_PRESETS = [
+    pytest.param(
+        ((1, 'Meal 1', 'Cuisine 1', 20.00, 'LOW'), (2, 'Meal 2', 'Cuisine 2', 25.00, 'MED')),
+        id="low_vs_med",
+    ),
+]
+
+
+@pytest.fixture(scope="module", params=COMBATANT_PRESETS)
+def test_meal_collection(request):
+    """Example meals for testing various cases, built once per module for each preset."""
+    return tuple(Meal(*row) for row in request.param)
 
 
 ##################################################
 # Battle Management Test Cases
 ##################################################
 
-def test_first_meal_wins(setup_battle, test_meal_1, test_meal_2, patch_meal_stats, mocker):
-    """Validate that test_meal_1 wins in the battle scenario."""
-    setup_battle.combatants = [test_meal_1, test_meal_2]
-    # Mock scores for test_meal_1 to ensure victory
-    mocker.patch.object(setup_battle, 'get_battle_score', side_effect=[90, 85])
-    mocker.patch("meal_max.models.battle_model.get_random", return_value=0.02) 
+@pytest.mark.parametrize("scores,rand,winner_idx", [([90, 85], 0.02, 0), ([85, 90], 0.05, 1)])
+def test_meal_wins(setup_battle, test_meal_collection, patch_meal_stats, mock_random, mocker, scores, rand, winner_idx):
+    """Validate that the meal favoured by the mocked scores wins the battle."""
+    setup_battle.combatants = list(test_meal_collection)
+    winner = test_meal_collection[winner_idx]
+    loser = test_meal_collection[1 - winner_idx]
+    # Mock scores so the expected meal secures victory
+    mocker.patch.object(setup_battle, 'get_battle_score', side_effect=scores)
+    mock_random.return_value = rand
     victor = setup_battle.battle()
-    assert victor == test_meal_1.meal, f"Expected winner to be {test_meal_1.meal}, but received {victor}"
-    patch_meal_stats.assert_any_call(test_meal_1.id, 'win')
-    patch_meal_stats.assert_any_call(test_meal_2.id, 'loss')
+    assert victor == winner.meal, f"Expected winner to be {winner.meal}, but received {victor}"
+    patch_meal_stats.assert_any_call(winner.id, 'win')
+    patch_meal_stats.assert_any_call(loser.id, 'loss')
     assert len(setup_battle.combatants) == 1
-    assert setup_battle.combatants[0] == test_meal_1
+    assert setup_battle.combatants[0] == winner
 
 
-def test_second_meal_wins(setup_battle, test_meal_1, test_meal_2, patch_meal_stats, mocker):
-    """Confirm that test_meal_2 is the battle's victor."""
-    setup_battle.combatants = [test_meal_1, test_meal_2]  
-    # Mock scores for test_meal_2 to secure victory
-    mocker.patch.object(setup_battle, 'get_battle_score', side_effect=[85, 90])
-    mocker.patch("meal_max.models.battle_model.get_random", return_value=0.05)  
-    victor = setup_battle.battle()
-    assert victor == test_meal_2.meal, f"Expected victor to be {test_meal_2.meal}, but received {victor}"
-    patch_meal_stats.assert_any_call(test_meal_2.id, 'win')
-    patch_meal_stats.assert_any_call(test_meal_1.id, 'loss')
-    assert len(setup_battle.combatants) == 1
-    assert setup_battle.combatants[0] == test_meal_2
-
-
-def test_battle_requires_two_combatants(setup_battle, test_meal_1):
-    """Assert error when attempting battle with a single combatant."""
-    # Only one combatant present
-    setup_battle.combatants = [test_meal_1]   
-    with pytest.raises(ValueError, match="Two combatants must be prepped for a battle."):
+@pytest.mark.parametrize("count", [0, 1], ids=["no_combatants", "single_combatant"])
+def test_battle_requires_two_combatants(setup_battle, test_meal_collection, count):
+    """Assert error when attempting battle with fewer than two combatants."""
+    setup_battle.combatants = list(test_meal_collection[:count])
+    with pytest.raises(ValueError, match=_RE_NOT_ENOUGH_COMBATANTS):
         setup_battle.battle()
 
 
@@ -75,75 +106,50 @@ def test_battle_requires_two_combatants(setup_battle, test_meal_1):
 # Meal Retrieval Test Cases
 ##################################################
 
-def test_retrieve_battle_score(setup_battle, test_meal_1):
-    """Check accurate calculation of battle score for a combatant meal."""
-    score = setup_battle.get_battle_score(test_meal_1)
-    calculated_score = (test_meal_1.price * len(test_meal_1.cuisine)) - 3
-    assert score == calculated_score, f"Expected score of {calculated_score}, received {score}"
+def test_retrieve_battle_score(setup_battle, test_meal_collection):
+    """Check accurate calculation of battle score for each combatant meal."""
+    difficulty_modifier = {"HIGH": 1, "MED": 2, "LOW": 3}
+    for meal in test_meal_collection:
+        score = setup_battle.get_battle_score(meal)
+        calculated_score = (meal.price * len(meal.cuisine)) - difficulty_modifier[meal.difficulty]
+        assert score == calculated_score, f"Expected score of {calculated_score}, received {score}"
 
 
 ##################################################
 # Combatant Management Functions
 ##################################################
 
-def test_empty_combatants_single_entry(setup_battle, test_meal_1):
-    """Test removal of all combatants when only one is present."""
-    setup_battle.combatants = [test_meal_1]
-    setup_battle.clear_combatants()
-    assert len(setup_battle.combatants) == 0, "Expected an empty combatant list post-clear"
-
-
-def test_empty_combatants_multiple_entries(setup_battle, test_meal_1, test_meal_2):
-    """Test removal of all combatants when multiple are present."""
-    setup_battle.combatants = [test_meal_1, test_meal_2]
-    setup_battle.clear_combatants()
-    assert len(setup_battle.combatants) == 0, "Expected an empty combatant list post-clear"
-
-
-def test_empty_combatants_initial_state(setup_battle):
-    """Test clearing combatants when the list is already empty."""
-    setup_battle.combatants = []
+@pytest.mark.parametrize("count", [1, 2, 0], ids=["single_entry", "multiple_entries", "initial_state"])
+def test_empty_combatants(setup_battle, test_meal_collection, count):
+    """Test removal of all combatants whether the list holds one, several or none."""
+    setup_battle.combatants = list(test_meal_collection[:count])
     setup_battle.clear_combatants()
     assert len(setup_battle.combatants) == 0, "Expected an empty combatant list post-clear"
 
 
-def test_list_all_combatants_multiple(setup_battle, test_meal_1, test_meal_2):
+@pytest.mark.parametrize("count", [2, 1], ids=["multiple", "single_entry"])
+def test_list_all_combatants(setup_battle, test_meal_collection, count):
     """Validate retrieval of all combatants from a populated list."""
-    setup_battle.combatants = [test_meal_1, test_meal_2]
-    combatants = setup_battle.get_combatants()
-    assert len(combatants) == 2
-    assert combatants[0].id == 1
-    assert combatants[1].id == 2
-
-
-def test_list_all_combatants_single_entry(setup_battle, test_meal_1):
-    """Validate retrieval of all combatants when only one exists."""
-    setup_battle.combatants = [test_meal_1]
+    setup_battle.combatants = list(test_meal_collection[:count])
     combatants = setup_battle.get_combatants()
-    assert len(combatants) == 1
-    assert combatants[0].id == 1
-
+    assert len(combatants) == count
+    assert [combatant.id for combatant in combatants] == [meal.id for meal in test_meal_collection[:count]]
 
-def test_prepare_dual_combatants(setup_battle, test_meal_1, test_meal_2):
-    """Verify successful preparation of two combatants."""
-    setup_battle.prep_combatant(test_meal_1)
-    setup_battle.prep_combatant(test_meal_2)
-    assert len(setup_battle.combatants) == 2
-    assert setup_battle.combatants == [test_meal_1, test_meal_2]
 
-
-def test_prepare_single_combatant(setup_battle, test_meal_1):
-    """Verify successful preparation of a lone combatant."""
-    setup_battle.prep_combatant(test_meal_1)
-    assert len(setup_battle.combatants) == 1
-    assert setup_battle.combatants == [test_meal_1]
+@pytest.mark.parametrize("count", [2, 1], ids=["dual", "single"])
+def test_prepare_combatants(setup_battle, test_meal_collection, count):
+    """Verify successful preparation of one or two combatants."""
+    for meal in test_meal_collection[:count]:
+        setup_battle.prep_combatant(meal)
+    assert len(setup_battle.combatants) == count
+    assert setup_battle.combatants == list(test_meal_collection[:count])
 
 
-def test_add_third_combatant_error(setup_battle, test_meal_1, test_meal_2):
+def test_add_third_combatant_error(setup_battle, test_meal_collection):
     """Check error raised upon trying to add a third combatant."""
-    setup_battle.prep_combatant(test_meal_1)
-    setup_battle.prep_combatant(test_meal_2)
+    for meal in test_meal_collection:
+        setup_battle.prep_combatant(meal)
     assert len(setup_battle.combatants) == 2, "Only two combatants should be prepped."
-    assert setup_battle.combatants == [test_meal_1, test_meal_2], "Combatants list does not match expected values."
-    with pytest.raises(ValueError, match="Combatant list is full, cannot add more combatants."):
+    assert setup_battle.combatants == list(test_meal_collection), "Combatants list does not match expected values."
+    with pytest.raises(ValueError, match=_RE_COMBATANTS_FULL):
         setup_battle.prep_combatant(Meal(3, 'Meal 3', 'Cuisine 3', 15.00, 'HIGH'))
@@ -1,7 +1,18 @@
+import re
+import sqlite3
+from unittest.mock import MagicMock
+
 import pytest
 from meal_max.models.kitchen_model import Meal, create_meal, delete_meal, get_meal_by_id, update_meal_stats
-from meal_max.utils.sql_utils import get_db_connection
-import sqlite3
+
+
+# All kitchen tests reuse the same connection and cursor mocks
+pytestmark = pytest.mark.xdist_group("kitchen")
+
+_RE_DUPLICATE_MEAL = re.compile(r"Meal with name 'Meal 1' already exists")
+_RE_ALREADY_DELETED = re.compile(r"Meal with ID 1 has been deleted")
+_RE_NOT_FOUND = re.compile(r"Meal with ID 1 not found")
+_RE_INVALID_RESULT = re.compile(r"Invalid result: draw")
 
 ######################################################
 #
@@ -9,19 +20,30 @@ import sqlite3
 #
 ######################################################
 
+def normalize_whitespace(sql_query: str) -> str:
+    return re.sub(r'\s+', ' ', sql_query).strip()
+
+
+# Connection and cursor mocks are built once and reset before each test
+_conn_template = MagicMock()
+_cursor_template = MagicMock()
+
+
 @pytest.fixture
-def mock_db_cursor(mocker):
+def mock_db_cursor(monkeypatch):
     """Fixture to mock database connection and cursor."""
-    mock_conn = mocker.Mock()
-    mock_cursor = mocker.Mock()
-    mock_conn.cursor.return_value = mock_cursor
+    _cursor_template.reset_mock(return_value=True, side_effect=True)
+    _conn_template.reset_mock()
+    _conn_template.cursor.return_value = _cursor_template
+    # get_db_connection is used as a context manager, so entering it yields the connection
+    _conn_template.__enter__.return_value = _conn_template
 
-    # Patch the get_db_connection to return the mocked connection
-    mocker.patch("meal_max.utils.sql_utils.get_db_connection", return_value=mock_conn)
-    return mock_cursor
+    # Patch get_db_connection where kitchen_model looks it up to return the mocked connection
+    monkeypatch.setattr("meal_max.models.kitchen_model.get_db_connection", lambda: _conn_template)
+    return _cursor_template
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_meal():
     """Fixture to provide a sample meal object."""
     return Meal(1, "Sample Meal", "Cuisine Type", 15.00, "MED")
@@ -36,37 +58,32 @@ def sample_meal():
 def test_create_meal_success(mock_db_cursor):
     """Test successfully creating a new meal in the database."""
     create_meal(meal="Meal 1", cuisine="Cuisine 1", price=10.0, difficulty="LOW")
-    mock_db_cursor.execute.assert_called_once_with(
-        "INSERT INTO meals (meal, cuisine, price, difficulty) VALUES (?, ?, ?, ?)",
-        ("Meal 1", "Cuisine 1", 10.0, "LOW")
-    )
+    mock_db_cursor.execute.assert_called_once()
+    query, args = mock_db_cursor.execute.call_args[0]
+    assert normalize_whitespace(query) == "INSERT INTO meals (meal, cuisine, price, difficulty) VALUES (?, ?, ?, ?)"
+    assert args == ("Meal 1", "Cuisine 1", 10.0, "LOW")
 
 
 def test_create_duplicate_meal(mock_db_cursor):
     """Test attempting to create a duplicate meal raises an error."""
     mock_db_cursor.execute.side_effect = sqlite3.IntegrityError("UNIQUE constraint failed")
-    with pytest.raises(ValueError, match="Meal with this name already exists"):
+    with pytest.raises(ValueError, match=_RE_DUPLICATE_MEAL):
         create_meal(meal="Meal 1", cuisine="Cuisine 1", price=10.0, difficulty="LOW")
 
-def test_delete_meal_success(mock_db_cursor):
-    """Test successfully marking a meal as deleted."""
-    mock_db_cursor.fetchone.return_value = (False,)  # Meal not deleted
-    delete_meal(1)
-    mock_db_cursor.execute.assert_any_call("UPDATE meals SET deleted = TRUE WHERE id = ?", (1,))
-
-
-def test_delete_meal_already_deleted(mock_db_cursor):
-    """Test attempting to delete a meal that is already marked as deleted."""
-    mock_db_cursor.fetchone.return_value = (True,)  # Meal already deleted
-    with pytest.raises(ValueError, match="Meal with ID 1 is already deleted"):
-        delete_meal(1)
-
-
-def test_delete_meal_not_found(mock_db_cursor):
-    """Test attempting to delete a meal that doesn't exist."""
-    mock_db_cursor.fetchone.return_value = None
-    with pytest.raises(ValueError, match="Meal with ID 1 not found"):
+@pytest.mark.parametrize("fetch,expect", [
+    ((False,), None),
+    ((True,), _RE_ALREADY_DELETED),
+    (None, _RE_NOT_FOUND),
+], ids=["success", "already_deleted", "not_found"])
+def test_delete_meal(mock_db_cursor, fetch, expect):
+    """Test marking a meal as deleted across its success, already-deleted and not-found states."""
+    mock_db_cursor.fetchone.return_value = fetch
+    if expect:
+        with pytest.raises(ValueError, match=expect):
+            delete_meal(1)
+    else:
         delete_meal(1)
+        mock_db_cursor.execute.assert_any_call("UPDATE meals SET deleted = TRUE WHERE id = ?", (1,))
 
 
 #######################################################
@@ -85,7 +102,7 @@ def test_get_meal_by_id_success(mock_db_cursor, sample_meal):
 def test_get_meal_by_id_not_found(mock_db_cursor):
     """Test retrieving a meal by an ID that doesn't exist."""
     mock_db_cursor.fetchone.return_value = None
-    with pytest.raises(ValueError, match="Meal with ID 1 not found"):
+    with pytest.raises(ValueError, match=_RE_NOT_FOUND):
         get_meal_by_id(1)
 
 
@@ -95,15 +112,26 @@ def test_get_meal_by_id_not_found(mock_db_cursor):
 #
 #######################################################
 
-def test_update_meal_stats_success(mock_db_cursor):
-    """Test successfully updating the stats of a meal."""
-    update_meal_stats(1, "win")
-    mock_db_cursor.execute.assert_called_once_with(
-        "UPDATE meals SET battles = battles + 1, wins = wins + 1 WHERE id = ?", (1,)
-    )
+@pytest.mark.parametrize("result,expected_sql", [
+    ("win", "UPDATE meals SET battles = battles + 1, wins = wins + 1 WHERE id = ?"),
+    ("loss", "UPDATE meals SET battles = battles + 1 WHERE id = ?"),
+])
+def test_update_meal_stats_success(mock_db_cursor, result, expected_sql):
+    """Test successfully updating the stats of a meal after a win or a loss."""
+    mock_db_cursor.fetchone.return_value = (False,)  # Meal exists and is not deleted
+    update_meal_stats(1, result)
+
+    # Both the existence check and the update must run, in that order
+    assert mock_db_cursor.execute.call_count == 2
+    (select_sql, select_args), _ = mock_db_cursor.execute.call_args_list[0]
+    (update_sql, update_args), _ = mock_db_cursor.execute.call_args_list[1]
+    assert normalize_whitespace(select_sql) == "SELECT deleted FROM meals WHERE id = ?"
+    assert normalize_whitespace(update_sql) == expected_sql
+    assert select_args == (1,) and update_args == (1,)
 
 
 def test_update_meal_stats_invalid_operation(mock_db_cursor):
     """Test updating meal stats with an invalid operation."""
-    with pytest.raises(ValueError, match="Invalid operation: draw"):
+    mock_db_cursor.fetchone.return_value = (False,)
+    with pytest.raises(ValueError, match=_RE_INVALID_RESULT):
         update_meal_stats(1, "draw")